@@ -2,28 +2,67 @@
 """
 Memento Mori wallpaper generator for Linux
 - Draws a 52×N grid (weeks × years) showing life progress
-- Writes a PNG
+- Writes a PNG (or a JPEG, see output_format)
 - Optionally tries to set your desktop wallpaper automatically
 
-Requires: Python 3, Pillow
-pip install --user pillow
+Requires: Python 3, Pillow (NumPy optional, speeds up the dot grid)
+pip install --user pillow numpy
+
+Pillow-SIMD is a drop-in replacement with SSE4/AVX2 drawing, compositing and
+resampling; it is picked up automatically when installed instead of Pillow:
+pip uninstall pillow && pip install --user pillow-simd
+
+If _grid.pyx has been compiled next to this script (cythonize -i _grid.pyx),
+its stamp() kernel draws the dots.
+
+With output_format = "jpeg", simplejpeg is used for encoding when installed:
+pip install --user simplejpeg
 
 Edit the CONFIG block below to set your birthdate, expected years, output path, etc.
 """
 from __future__ import annotations
+import hashlib
 import math
 import os
 import shutil
 import subprocess
 from datetime import datetime, date
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
 from typing import Tuple
 
 try:
+    import PIL
     from PIL import Image, ImageDraw, ImageFont
 except Exception as e:
     raise SystemExit("Pillow is required. Install with: pip install --user pillow") from e
 
+try:
+    import numpy as np
+except ImportError:  # optional: falls back to drawing dots one by one
+    np = None
+
+try:
+    from _grid import stamp as cy_stamp
+except ImportError:  # optional: compiled dot stamping, see _grid.pyx
+    cy_stamp = None
+
+
+@lru_cache(maxsize=8)
+def parse_date(s: str) -> date:
+    return datetime.strptime(s, "%Y-%m-%d").date()
+
+
+def end_date(birth: date, years: int) -> date:
+    """birth + years, moving Feb 29 to Feb 28 on non-leap years."""
+    try:
+        return date(birth.year + years, birth.month, birth.day)
+    except ValueError:
+        if birth.month == 2 and birth.day == 29:
+            return date(birth.year + years, 2, 28)
+        raise
+
+
 # ----------------------- CONFIG -----------------------
 @dataclass
 class Config:
@@ -38,6 +77,13 @@ class Config:
 
     # Path to save the generated image (use an absolute path)
     output_path: str = os.path.expanduser("~/.local/share/memento_mori/wallpaper.png")
+    # "png" or "jpeg"/"jpg" (JPEG encodes faster); output_path must have a matching extension
+    output_format: str = "png"
+    # zlib level for the PNG (0-9); 1 is fastest, the flat image compresses well anyway
+    png_compress_level: int = 1
+    jpeg_quality: int = 92
+    # Rendered wallpapers (per config + day) and the empty dot grid are cached here; None always re-renders
+    cache_dir: str | None = os.path.expanduser("~/.cache/memento_mori")
 
     # Theme & style
     dark_theme: bool = True
@@ -54,33 +100,45 @@ class Config:
     # Try to set wallpaper after generating
     set_wallpaper: bool = True
 
+    # Derived once at startup from the settings above (not meant to be edited)
+    _birth: date = field(init=False, repr=False)
+    _death: date = field(init=False, repr=False)
+    _days_total: int = field(init=False, repr=False)
+    _out_path: str = field(init=False, repr=False)
+    _format: str = field(init=False, repr=False)
+    _ext: str = field(init=False, repr=False)
+    _font_ok: bool = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._birth = parse_date(self.birthdate)
+        self._death = end_date(self._birth, self.expected_years)
+        self._days_total = (self._death - self._birth).days
+        self._out_path = os.path.abspath(os.path.expanduser(self.output_path))
+        fmt = self.output_format.lower()
+        self._format = "jpeg" if fmt == "jpg" else fmt
+        if self._format not in ("png", "jpeg"):
+            raise ValueError(f"output_format must be 'png' or 'jpeg', not {self.output_format!r}")
+        self._ext = ".jpg" if self._format == "jpeg" else ".png"
+        if os.path.splitext(self._out_path)[1].lower() not in ((".jpg", ".jpeg") if self._format == "jpeg" else (".png",)):
+            raise ValueError(f"output_path {self.output_path!r} does not match output_format {self.output_format!r}")
+        self._font_ok = bool(self.font_path and os.path.exists(self.font_path))
+
 cfg = Config()
 # --------------------- END CONFIG ---------------------
 
-
-def parse_date(s: str) -> date:
-    return datetime.strptime(s, "%Y-%m-%d").date()
+# cached renders are named <script>-<render key>.png (.jpg for JPEG output)
+CACHE_PREFIX = os.path.splitext(os.path.basename(__file__))[0] + "-"
+# and the empty dot grid for the current geometry empty-grid-<script>-<geometry key>.png
+GRID_PREFIX = "empty-grid-" + CACHE_PREFIX
 
 
-def life_fraction(birth: date, expected_years: int, today: date | None = None) -> Tuple[float, int, int, int]:
+def life_fraction(today: date) -> Tuple[float, int, int, int]:
     """
     Returns (fraction_lived, days_lived, days_total, week_index).
     week_index is based on a uniform split of total days into columns*rows cells.
     """
-    if today is None:
-        today = date.today()
-    death = date(birth.year + expected_years, birth.month, birth.day)
-    # Handle Feb 29 gracefully by moving to Feb 28 on non-leap years
-    try:
-        death = date(birth.year + expected_years, birth.month, birth.day)
-    except ValueError:
-        if birth.month == 2 and birth.day == 29:
-            death = date(birth.year + expected_years, 2, 28)
-        else:
-            raise
-
-    days_lived = (today - birth).days
-    days_total = (death - birth).days
+    days_lived = (today - cfg._birth).days
+    days_total = cfg._days_total
     frac = max(0.0, min(1.0, days_lived / days_total)) if days_total > 0 else 1.0
 
     total_cells = cfg.columns * cfg.expected_years
@@ -123,8 +181,9 @@ def pick_colors(dark: bool):
     return bg, fg, muted, active, filled, empty
 
 
+@lru_cache(maxsize=16)
 def try_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
-    if cfg.font_path and os.path.exists(cfg.font_path):
+    if cfg._font_ok:
         try:
             return ImageFont.truetype(cfg.font_path, size=size)
         except Exception:
@@ -132,21 +191,249 @@ def try_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
     return ImageFont.load_default()
 
 
+# Scratch surface for measuring text without drawing it
+_MEASURE = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+
+
+@lru_cache(maxsize=64)
+def text_size(text: str, size: int) -> Tuple[int, int]:
+    """
+    (width, height) of text in the configured font at the given size.
+    ImageDraw.textsize is gone in Pillow 10; like it, this measures from the
+    d.text origin, i.e. the right/bottom edges of the box anchored at (0, 0).
+    """
+    _, _, right, bottom = _MEASURE.textbbox((0, 0), text, font=try_font(size))
+    return right, bottom
+
+
+def dot_sprite(radius: int) -> Image.Image:
+    """
+    A (2r+1)x(2r+1) "L" mask of one dot, rasterized once and reused as a paste mask.
+    Drawn with the same d.ellipse call as before, so pasted dots are pixel-identical.
+    """
+    size = 2 * radius + 1
+    sprite = Image.new("L", (size, size), 0)
+    ImageDraw.Draw(sprite).ellipse((0, 0, size - 1, size - 1), fill=255)
+    return sprite
+
+
+def disc_mask(radius: int):
+    """Boolean version of dot_sprite() for the NumPy raster."""
+    return np.asarray(dot_sprite(radius)) > 0
+
+
+# Palette indices of the grid layer
+GRID_BG, GRID_FILLED, GRID_EMPTY = 0, 1, 2
+
+
+def dot_centers(rows: int, cols: int, radius: int, gap: int, x0: int = 0, y0: int = 0):
+    """(CX, CY) arrays of shape (rows, cols) holding every dot center, built with np.arange."""
+    pitch = 2 * radius + gap
+    cx = x0 + np.arange(cols) * pitch + radius
+    cy = y0 + np.arange(rows) * pitch + radius
+    return np.meshgrid(cx, cy)
+
+
+def stamp_first(buf, n: int, cols: int, radius: int, gap: int, index: int) -> None:
+    """
+    Set the first n dots (row-major) of a grid index buffer with NumPy: the full
+    rows through one tiled disc mask, then the partial row after them.
+    """
+    pitch = 2 * radius + gap
+    cell = np.zeros((pitch, pitch), dtype=bool)
+    cell[:2 * radius + 1, :2 * radius + 1] = disc_mask(radius)
+    full, rest = divmod(n, cols)
+    for region, reps in ((buf[:full * pitch], (full, cols)),
+                         (buf[full * pitch:(full + 1) * pitch, :rest * pitch], (1, rest))):
+        if region.size:
+            region[np.tile(cell, reps)[:region.shape[0], :region.shape[1]]] = index
+
+
+def paste_first(img: Image.Image, n: int, cols: int, radius: int, gap: int, index: int) -> None:
+    """Pure-Pillow fallback for stamp_first: blits the dot sprite for each of the first n dots."""
+    pitch = 2 * radius + gap
+    dot = dot_sprite(radius)
+    # Dot offsets along x, computed once instead of per cell
+    xs = range(0, cols * pitch, pitch)
+    for idx in range(n):
+        r, c = divmod(idx, cols)
+        img.paste(index, (xs[c], r * pitch), dot)
+
+
+def fill_dots(img: Image.Image, n: int, cols: int, radius: int, gap: int, index: int) -> Image.Image:
+    """
+    Set the first n dots of a grid layer to a palette index: with the compiled
+    _grid kernel when built, else the tiled NumPy mask (which needs gap >= 1 so
+    cells don't overlap), else sprite pastes.
+    """
+    if np is None or gap <= 0:
+        paste_first(img, n, cols, radius, gap, index)
+        return img
+    buf = np.array(img)
+    if cy_stamp is not None:
+        centers_x, centers_y = dot_centers(-(-n // cols), cols, radius, gap)
+        cy_stamp(buf, centers_x.ravel()[:n].astype(np.intp), centers_y.ravel()[:n].astype(np.intp),
+                 disc_mask(radius).view(np.uint8), index)
+    else:
+        stamp_first(buf, n, cols, radius, gap, index)
+    out = Image.fromarray(buf, "P")
+    out.putpalette(img.getpalette())
+    return out
+
+
+def empty_grid(rows: int, cols: int, radius: int, gap: int) -> Image.Image:
+    """
+    The grid layer with every dot empty, as palette indices (no palette attached).
+    It only depends on geometry, so it is rendered once and loaded from
+    cfg.cache_dir on later runs.
+    """
+    key = hashlib.sha1(repr((rows, cols, radius, gap)).encode()).hexdigest()[:16]
+    path = os.path.join(cfg.cache_dir, f"{GRID_PREFIX}{key}.png") if cfg.cache_dir else None
+    if path:
+        try:
+            with Image.open(path) as cached:
+                cached.load()
+                return cached
+        except FileNotFoundError:
+            pass  # not cached yet, or just pruned by another run
+
+    pitch = 2 * radius + gap
+    grid_img = Image.new("P", (cols * pitch - gap + 1, rows * pitch - gap + 1), GRID_BG)
+    grid_img.putpalette(bytes(3 * 3))
+    grid_img = fill_dots(grid_img, rows * cols, cols, radius, gap, GRID_EMPTY)
+    if path:
+        os.makedirs(cfg.cache_dir, exist_ok=True)
+        prune_cache(GRID_PREFIX)  # grids of earlier geometries
+        write_atomically(path, lambda tmp: grid_img.save(tmp, "PNG", compress_level=cfg.png_compress_level))
+    return grid_img
+
+
+def paint_grid(rows: int, cols: int, n_filled: int, radius: int, gap: int) -> Image.Image:
+    """
+    Grid layer for gap <= 0, where neighbouring dots overlap: every dot is pasted
+    in week order, so an empty dot covers the filled one before it as it always
+    has, which filling on top of the cached empty grid would get backwards.
+    """
+    pitch = 2 * radius + gap
+    grid_img = Image.new("P", (cols * pitch - gap + 1, rows * pitch - gap + 1), GRID_BG)
+    dot = dot_sprite(radius)
+    for idx in range(rows * cols):
+        r, c = divmod(idx, cols)
+        grid_img.paste(GRID_FILLED if idx < n_filled else GRID_EMPTY, (c * pitch, r * pitch), dot)
+    return grid_img
+
+
+def render_grid(rows: int, cols: int, n_filled: int, radius: int, gap: int,
+                bg, filled, empty) -> Image.Image:
+    """
+    The dot grid as a "P" (palette) layer of its own size, with the first n_filled
+    weeks filled. One byte per pixel instead of three while drawing; the layer is
+    converted to RGB when pasted onto the wallpaper. Starts from the cached
+    all-empty grid so only the filled dots are drawn.
+    """
+    n_filled = max(0, min(rows * cols, n_filled))
+    if gap <= 0:
+        grid_img = paint_grid(rows, cols, n_filled, radius, gap)
+        grid_img.putpalette(bytes(bg + filled + empty))
+        return grid_img
+    grid_img = empty_grid(rows, cols, radius, gap)
+    grid_img.putpalette(bytes(bg + filled + empty))
+    return fill_dots(grid_img, n_filled, cols, radius, gap, GRID_FILLED)
+
+
+def write_atomically(out_path: str, write) -> None:
+    """
+    Call write(tmp_path) and move the result over out_path with os.replace, so
+    readers (the wallpaper daemon, a concurrent run) only ever see a complete file.
+    """
+    tmp = f"{out_path}.tmp.{os.getpid()}"
+    try:
+        write(tmp)
+        os.replace(tmp, out_path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def save_image(img: Image.Image, out_path: str) -> None:
+    """Encode the wallpaper in cfg.output_format, using simplejpeg for JPEG when installed."""
+    def write(path: str) -> None:
+        if cfg._format == "jpeg":
+            try:
+                import simplejpeg  # optional: faster JPEG encoding than Pillow, only loaded for JPEG output
+            except ImportError:
+                simplejpeg = None
+            if simplejpeg is not None and np is not None:
+                data = simplejpeg.encode_jpeg(np.asarray(img), quality=cfg.jpeg_quality, colorspace="RGB")
+                with open(path, "wb") as f:
+                    f.write(data)
+            else:
+                img.save(path, "JPEG", quality=cfg.jpeg_quality)
+        else:
+            img.save(path, "PNG", compress_level=cfg.png_compress_level)
+
+    write_atomically(out_path, write)
+
+
+def render_key(current_cell: int, today: date) -> str:
+    """
+    Short hash of everything that affects the rendered image: the config, the
+    current week, today's date (shown in the footer) and this script itself.
+    """
+    # _format stands in for output_format, so "jpg" and "jpeg" share renders
+    settings = sorted((k, v) for k, v in asdict(cfg).items() if k != "output_format")
+    state = (settings, current_cell, today.isoformat(), os.path.getmtime(__file__))
+    return hashlib.sha1(repr(state).encode()).hexdigest()[:16]
+
+
+def prune_cache(prefix: str) -> None:
+    """Remove the cached images whose names start with prefix."""
+    for name in os.listdir(cfg.cache_dir):
+        if name.startswith(prefix) and name.endswith((".png", ".jpg")):
+            try:
+                os.remove(os.path.join(cfg.cache_dir, name))
+            except FileNotFoundError:  # already pruned by an overlapping run
+                pass
+
+
+def store_cached(out_path: str, key: str) -> None:
+    """Copy a freshly rendered wallpaper into the cache, dropping older renders."""
+    os.makedirs(cfg.cache_dir, exist_ok=True)
+    prune_cache(CACHE_PREFIX)
+    cached = os.path.join(cfg.cache_dir, f"{CACHE_PREFIX}{key}{cfg._ext}")
+    write_atomically(cached, lambda tmp: shutil.copyfile(out_path, tmp))
+
+
 def draw_wallpaper() -> str:
-    birth = parse_date(cfg.birthdate)
+    birth = cfg._birth
     today = date.today()
-    frac, days_lived, days_total, current_cell = life_fraction(birth, cfg.expected_years, today)
+    frac, days_lived, days_total, current_cell = life_fraction(today)
+
+    # Ensure output dir
+    out_path = cfg._out_path
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+
+    # Nothing changed since the last run today: reuse the previous render
+    key = render_key(current_cell, today)
+    if cfg.cache_dir:
+        cached = os.path.join(cfg.cache_dir, f"{CACHE_PREFIX}{key}{cfg._ext}")
+        try:
+            write_atomically(out_path, lambda tmp: shutil.copyfile(cached, tmp))
+            return out_path
+        except FileNotFoundError:
+            pass  # not cached yet, or just pruned by another run
 
     bg, fg, muted, active, filled, empty = pick_colors(cfg.dark_theme)
     img = Image.new("RGB", (cfg.width, cfg.height), bg)
     d = ImageDraw.Draw(img)
 
     # Title and stats
-    title_font = try_font(96)
-    sub_font = try_font(40)
-    small_font = try_font(28)
+    title_size, sub_size, small_size = 96, 40, 28
+    title_font = try_font(title_size)
+    sub_font = try_font(sub_size)
+    small_font = try_font(small_size)
 
-    title_w, title_h = d.textsize(cfg.title, font=title_font)
+    title_w, title_h = text_size(cfg.title, title_size)
     d.text(((cfg.width - title_w) // 2, 60), cfg.title, fill=fg, font=title_font)
 
     pct = f"{frac*100:0.2f}%"
@@ -154,7 +441,7 @@ def draw_wallpaper() -> str:
     remaining = format_duration(max(0, days_total - days_lived))
 
     stats_line = f"Lived: {lived}   •   Remaining: {remaining}   •   {pct}"
-    stats_w, stats_h = d.textsize(stats_line, font=sub_font)
+    stats_w, stats_h = text_size(stats_line, sub_size)
     d.text(((cfg.width - stats_w) // 2, 60 + title_h + 20), stats_line, fill=muted, font=sub_font)
 
     # Grid geometry
@@ -173,51 +460,75 @@ def draw_wallpaper() -> str:
 
     # Draw legend
     legend = "Each circle = 1 week • Rows = years • 52 columns per year"
-    leg_w, _ = d.textsize(legend, font=small_font)
+    leg_w, _ = text_size(legend, small_size)
     d.text(((cfg.width - leg_w) // 2, start_y - 50), legend, fill=muted, font=small_font)
 
-    # Draw grid of dots
-    total_cells = rows * cols
-    for r in range(rows):
-        for c in range(cols):
-            idx = r * cols + c
-            cx = start_x + c * (2 * radius + gap) + radius
-            cy = start_y + r * (2 * radius + gap) + radius
-
-            color = filled if idx <= current_cell else empty
-            d.ellipse((cx - radius, cy - radius, cx + radius, cy + radius), fill=color, outline=None)
+    # Draw grid of dots (weeks up to current_cell filled) and paste it onto the wallpaper once
+    # Only the dots are copied: the stats line can reach into the grid area and must stay visible.
+    # With show_today the current week's dot is left to the highlight below.
+    n_filled = current_cell if cfg.show_today else current_cell + 1
+    grid_img = render_grid(rows, cols, n_filled, radius, gap, bg, filled, empty)
+    img.paste(grid_img, (start_x, start_y), grid_img.point([0 if i == GRID_BG else 255 for i in range(256)], "1"))
 
-    # Highlight today's box
+    # Highlight today's box: the current week's dot and its outline
     if cfg.show_today:
         r = current_cell // cols
         c = current_cell % cols
         cx = start_x + c * (2 * radius + gap) + radius
         cy = start_y + r * (2 * radius + gap) + radius
         pad = max(3, radius // 2)
-        d.rectangle(
+        d.ellipse((cx - radius, cy - radius, cx + radius, cy + radius), fill=filled)
+        d.rounded_rectangle(
             (cx - radius - pad, cy - radius - pad, cx + radius + pad, cy + radius + pad),
-            outline=active, width=3
+            radius=pad, outline=active, width=3
         )
 
     # Footer
     footer = f"Born {birth.isoformat()} • Today {today.isoformat()} • Expectancy {cfg.expected_years}y"
-    foot_w, _ = d.textsize(footer, font=small_font)
+    foot_w, _ = text_size(footer, small_size)
     d.text(((cfg.width - foot_w) // 2, start_y + grid_h + 40), footer, fill=muted, font=small_font)
 
-    # Ensure output dir
-    out_path = os.path.abspath(os.path.expanduser(cfg.output_path))
-    os.makedirs(os.path.dirname(out_path), exist_ok=True)
-    img.save(out_path, "PNG", optimize=True)
+    save_image(img, out_path)
+    if cfg.cache_dir:
+        store_cached(out_path, key)
     return out_path
 
 
+@lru_cache(maxsize=1)
+def path_commands() -> frozenset:
+    """Every file name on $PATH, collected with one listdir per directory."""
+    names = set()
+    for d in os.environ.get("PATH", "").split(os.pathsep):
+        try:
+            names.update(os.listdir(d))
+        except OSError:
+            pass
+    return frozenset(names)
+
+
 def cmd_exists(cmd: str) -> bool:
-    return shutil.which(cmd) is not None
+    return cmd in path_commands()
 
 
 def set_wallpaper(path: str) -> bool:
     """Try a few common desktop environments; return True on success."""
-    # 1) GNOME (gsettings)
+    # 1) GNOME: all three background keys in one `dconf load`, else one gsettings call per key
+    if cmd_exists("gsettings") and cmd_exists("dconf"):
+        uri = "file://" + path.replace("\\", "\\\\").replace("'", "\\'")
+        payload = (
+            "[/]\n"
+            f"picture-uri='{uri}'\n"
+            f"picture-uri-dark='{uri}'\n"
+            "picture-options='scaled'\n"
+        )
+        try:
+            subprocess.run(
+                ["dconf", "load", "/org/gnome/desktop/background/"], input=payload.encode(),
+                check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+            return True
+        except Exception:
+            pass
     if cmd_exists("gsettings"):
         # Set both light/dark URIs when available
         uri = f"file://{path}"
@@ -277,7 +588,14 @@ def set_wallpaper(path: str) -> bool:
     return False
 
 
+def pillow_version() -> str:
+    # Pillow-SIMD releases carry a ".postN" suffix, e.g. "9.5.0.post1"
+    simd = " (SIMD)" if "post" in PIL.__version__ else ""
+    return f"Pillow {PIL.__version__}{simd}"
+
+
 def main():
+    print(f"Using {pillow_version()}")
     out = draw_wallpaper()
     print(f"Generated: {out}")
     if cfg.set_wallpaper:
@@ -5,20 +5,50 @@ Memento Mori wallpaper generator (v2)
 - Support for arranging years into multiple columns (e.g., 2 tall columns of years)
 - KDE fallback robustness is preserved
 
-Requires: Pillow
-pip install --user pillow
+Requires: Pillow (NumPy optional, speeds up the dot grid)
+pip install --user pillow numpy
+Optional: simplejpeg for output_format="jpeg" (pip install --user simplejpeg)
+Optional: compile _grid.pyx next to this script (cythonize -i _grid.pyx) for the dot stamping loop
+Optional: Numba compiles the dot stamping loop (pip install --user numba, then set use_numba);
+only worth it on grids much larger than the default, as loading numba alone takes ~0.3 s
+Optional: Pillow-SIMD is a faster drop-in replacement (pip uninstall pillow && pip install --user pillow-simd)
 """
 from __future__ import annotations
-import os, shutil, subprocess
+import hashlib, os, shutil, subprocess
 from datetime import datetime, date
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
 from typing import Tuple
 
 try:
+    import PIL
     from PIL import Image, ImageDraw, ImageFont
 except Exception as e:
     raise SystemExit("Pillow is required. Install with: pip install --user pillow") from e
 
+try:
+    import numpy as np
+except ImportError:  # optional: falls back to drawing dots one by one
+    np = None
+
+try:
+    from _grid import stamp as cy_stamp
+except ImportError:  # optional: compiled dot stamping, see _grid.pyx
+    cy_stamp = None
+
+@lru_cache(maxsize=8)
+def parse_date(s: str) -> date:
+    return datetime.strptime(s, "%Y-%m-%d").date()
+
+def end_date(birth: date, years: int) -> date:
+    # handle Feb 29 safely
+    try:
+        return date(birth.year + years, birth.month, birth.day)
+    except ValueError:
+        if birth.month == 2 and birth.day == 29:
+            return date(birth.year + years, 2, 28)
+        raise
+
 # ----------------------- CONFIG -----------------------
 @dataclass
 class Config:
@@ -28,6 +58,10 @@ class Config:
     width: int = 2560
     height: int = 1440
     output_path: str = os.path.expanduser("~/.local/share/memento_mori/wallpaper.png")
+    output_format: str = "png"  # "png" or "jpeg"/"jpg" (faster encode); output_path must have a matching extension
+    png_compress_level: int = 1  # zlib level 0-9; 1 = fastest encode
+    jpeg_quality: int = 92
+    cache_dir: str | None = os.path.expanduser("~/.cache/memento_mori")  # renders + empty dot grid; None = always re-render
 
     # Visuals
     dark_theme: bool = True
@@ -47,29 +81,45 @@ class Config:
     # Arrange years into multiple vertical blocks placed side-by-side.
     year_columns: int = 2
     block_gap: int = 120  # horizontal gap between year blocks
+    use_numba: bool = False  # stamp dots with a Numba kernel (slower than NumPy at this grid size)
 
     # Wallpaper application
     set_wallpaper: bool = True
 
+    # Derived once at startup from the settings above
+    _birth: date = field(init=False, repr=False)
+    _death: date = field(init=False, repr=False)
+    _days_total: int = field(init=False, repr=False)
+    _out_path: str = field(init=False, repr=False)
+    _format: str = field(init=False, repr=False)
+    _ext: str = field(init=False, repr=False)
+    _font_ok: bool = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._birth = parse_date(self.birthdate)
+        self._death = end_date(self._birth, self.expected_years)
+        self._days_total = (self._death - self._birth).days
+        self._out_path = os.path.abspath(os.path.expanduser(self.output_path))
+        fmt = self.output_format.lower()
+        self._format = "jpeg" if fmt == "jpg" else fmt
+        if self._format not in ("png", "jpeg"):
+            raise ValueError(f"output_format must be 'png' or 'jpeg', not {self.output_format!r}")
+        self._ext = ".jpg" if self._format == "jpeg" else ".png"
+        if os.path.splitext(self._out_path)[1].lower() not in ((".jpg", ".jpeg") if self._format == "jpeg" else (".png",)):
+            raise ValueError(f"output_path {self.output_path!r} does not match output_format {self.output_format!r}")
+        self._font_ok = bool(self.font_path and os.path.exists(self.font_path))
+
 cfg = Config()
 # --------------------- END CONFIG ---------------------
 
-def parse_date(s: str) -> date:
-    return datetime.strptime(s, "%Y-%m-%d").date()
+# cached renders are named <script>-<render key>.png (.jpg for JPEG output)
+CACHE_PREFIX = os.path.splitext(os.path.basename(__file__))[0] + "-"
+# and the empty dot grid for the current geometry empty-grid-<script>-<geometry key>.png
+GRID_PREFIX = "empty-grid-" + CACHE_PREFIX
 
-def life_fraction(birth: date, expected_years: int, today: date | None = None) -> Tuple[float, int, int, int]:
-    if today is None:
-        today = date.today()
-    # estimate end date (handle Feb 29 safely)
-    try:
-        death = date(birth.year + expected_years, birth.month, birth.day)
-    except ValueError:
-        if birth.month == 2 and birth.day == 29:
-            death = date(birth.year + expected_years, 2, 28)
-        else:
-            raise
-    days_lived = (today - birth).days
-    days_total = (death - birth).days
+def life_fraction(today: date) -> Tuple[float, int, int, int]:
+    days_lived = (today - cfg._birth).days
+    days_total = cfg._days_total
     frac = max(0.0, min(1.0, days_lived / days_total)) if days_total > 0 else 1.0
     total_cells = cfg.weeks_per_year * cfg.expected_years
     current_cell = int(frac * total_cells)
@@ -96,30 +146,239 @@ def pick_colors(dark: bool):
         active = (0, 110, 220); filled = (30, 36, 44); empty = (198, 204, 212); grid_shadow = (225, 229, 235)
     return bg, fg, muted, active, filled, empty, grid_shadow
 
+@lru_cache(maxsize=16)
 def try_font(size: int):
-    if cfg.font_path and os.path.exists(cfg.font_path):
+    if cfg._font_ok:
         try:
             return ImageFont.truetype(cfg.font_path, size=size)
         except Exception:
             pass
     return ImageFont.load_default()
 
+
+# scratch surface for measuring text without drawing it
+_MEASURE = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+
+@lru_cache(maxsize=64)
+def text_size(text: str, size: int) -> Tuple[int, int]:
+    # textbbox replaces textsize (removed in Pillow 10); measured from the d.text origin as textsize was
+    _, _, right, bottom = _MEASURE.textbbox((0, 0), text, font=try_font(size))
+    return right, bottom
+
+@lru_cache(maxsize=64)
+def text_sprite(text: str, size: int) -> Tuple[Image.Image, Tuple[int, int]]:
+    """Rasterize text once into an "L" coverage mask; returns (mask, offset from the d.text origin)."""
+    left, top, right, bottom = _MEASURE.textbbox((0, 0), text, font=try_font(size))
+    mask = Image.new("L", (max(1, right - left), max(1, bottom - top)), 0)
+    ImageDraw.Draw(mask).text((-left, -top), text, fill=255, font=try_font(size))
+    return mask, (left, top)
+
+def dot_sprite(radius: int) -> Image.Image:
+    # one dot rasterized once and reused as a paste mask (same pixels as d.ellipse)
+    size = 2 * radius + 1
+    sprite = Image.new("L", (size, size), 0)
+    ImageDraw.Draw(sprite).ellipse((0, 0, size - 1, size - 1), fill=255)
+    return sprite
+
+def disc_mask(radius: int):
+    return np.asarray(dot_sprite(radius)) > 0
+
+GRID_BG, GRID_FILLED, GRID_EMPTY = 0, 1, 2  # palette indices of the grid layer
+
+@lru_cache(maxsize=1)
+def numba_stamp():
+    """Numba-compiled dot stamping kernel, or None without numba. Imported on first use: numba is slow to load."""
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True, cache=True)
+    def stamp_dots(buf, disc, centers_x, centers_y, index):
+        # copy the disc into buf around every center, one dot per parallel iteration
+        r = disc.shape[0] // 2
+        for i in prange(centers_x.size):
+            y0, x0 = centers_y[i] - r, centers_x[i] - r
+            for dy in range(disc.shape[0]):
+                for dx in range(disc.shape[1]):
+                    if disc[dy, dx]:
+                        buf[y0 + dy, x0 + dx] = index
+    return stamp_dots
+
+def dot_centers(rows: int, cols: int, radius: int, gap: int, x0: int = 0, y0: int = 0):
+    """(CX, CY) arrays of shape (rows, cols) holding every dot center, built with two np.arange calls."""
+    pitch = 2*radius + gap
+    cx = x0 + np.arange(cols) * pitch + radius
+    cy = y0 + np.arange(rows) * pitch + radius
+    return np.meshgrid(cx, cy)
+
+def stamp_first(buf, n: int, cols: int, radius: int, gap: int, index: int) -> None:
+    """Set the first n dots (row-major) of a grid index buffer: full rows with one tiled disc mask, then the partial row."""
+    pitch = 2*radius + gap
+    cell = np.zeros((pitch, pitch), dtype=bool)
+    cell[:2*radius + 1, :2*radius + 1] = disc_mask(radius)
+    full, rest = divmod(n, cols)
+    for region, reps in ((buf[:full * pitch], (full, cols)),
+                         (buf[full * pitch:(full + 1) * pitch, :rest * pitch], (1, rest))):
+        if region.size:
+            region[np.tile(cell, reps)[:region.shape[0], :region.shape[1]]] = index
+
+def paste_first(img: Image.Image, n: int, cols: int, radius: int, gap: int, index: int) -> None:
+    """Pure-Pillow fallback for stamp_first: pastes the dot sprite for each of the first n dots."""
+    pitch = 2*radius + gap
+    dot = dot_sprite(radius)
+    xs = range(0, cols * pitch, pitch)  # dot offsets, computed once
+    for idx in range(n):
+        r, c = divmod(idx, cols)
+        img.paste(index, (xs[c], r * pitch), dot)
+
+def fill_dots(img: Image.Image, n: int, cols: int, radius: int, gap: int, index: int) -> Image.Image:
+    # set the first n dots to a palette index: compiled _grid kernel, Numba kernel (use_numba), else
+    # one tiled NumPy mask (the tiling needs gap >= 1 so cells don't overlap)
+    if np is None or gap <= 0:
+        paste_first(img, n, cols, radius, gap, index)
+        return img
+    buf = np.array(img)
+    stamp_dots = numba_stamp() if cfg.use_numba and cy_stamp is None else None
+    if cy_stamp is not None or stamp_dots is not None:
+        centers_x, centers_y = dot_centers(-(-n // cols), cols, radius, gap)
+        centers_x, centers_y = centers_x.ravel()[:n], centers_y.ravel()[:n]
+        if cy_stamp is not None:
+            cy_stamp(buf, centers_x.astype(np.intp), centers_y.astype(np.intp), disc_mask(radius).view(np.uint8), index)
+        else:
+            stamp_dots(buf, disc_mask(radius), centers_x, centers_y, index)
+    else:
+        stamp_first(buf, n, cols, radius, gap, index)
+    out = Image.fromarray(buf, "P")
+    out.putpalette(img.getpalette())
+    return out
+
+def empty_grid(rows: int, cols: int, radius: int, gap: int) -> Image.Image:
+    """
+    The all-empty grid as palette indices; depends only on geometry, so it is rendered once and loaded
+    from cfg.cache_dir later. One grid as tall as the tallest block is cached and cropped for each block.
+    """
+    tallest = max(rows, -(-cfg.expected_years // max(1, cfg.year_columns)))
+    pitch = 2*radius + gap
+    key = hashlib.sha1(repr((tallest, cols, radius, gap)).encode()).hexdigest()[:16]
+    path = os.path.join(cfg.cache_dir, f"{GRID_PREFIX}{key}.png") if cfg.cache_dir else None
+    grid_img = None
+    if path:
+        try:
+            with Image.open(path) as cached:
+                cached.load()
+                grid_img = cached
+        except FileNotFoundError:
+            pass  # not cached yet, or just pruned by another run
+    if grid_img is None:
+        grid_img = Image.new("P", (cols * pitch - gap + 1, tallest * pitch - gap + 1), GRID_BG)
+        grid_img.putpalette(bytes(3 * 3))
+        grid_img = fill_dots(grid_img, tallest * cols, cols, radius, gap, GRID_EMPTY)
+        if path:
+            os.makedirs(cfg.cache_dir, exist_ok=True)
+            prune_cache(GRID_PREFIX)  # grids of earlier geometries
+            write_atomically(path, lambda tmp: grid_img.save(tmp, "PNG", compress_level=cfg.png_compress_level))
+    return grid_img.crop((0, 0, grid_img.width, rows * pitch - gap + 1)) if rows < tallest else grid_img
+
+def paint_grid(rows: int, cols: int, n_filled: int, radius: int, gap: int) -> Image.Image:
+    """Grid layer for gap <= 0: neighbouring dots overlap, so every dot is pasted in week order (a later empty dot covers a filled one)."""
+    pitch = 2*radius + gap
+    grid_img = Image.new("P", (cols * pitch - gap + 1, rows * pitch - gap + 1), GRID_BG)
+    dot = dot_sprite(radius)
+    for idx in range(rows * cols):
+        r, c = divmod(idx, cols)
+        grid_img.paste(GRID_FILLED if idx < n_filled else GRID_EMPTY, (c * pitch, r * pitch), dot)
+    return grid_img
+
+def render_grid(rows: int, cols: int, n_filled: int, radius: int, gap: int, bg, filled, empty) -> Image.Image:
+    """Grid layer in "P" mode (1 byte/px while drawing), first n_filled dots filled on top of the cached empty grid."""
+    n_filled = max(0, min(rows * cols, n_filled))
+    if gap <= 0:
+        grid_img = paint_grid(rows, cols, n_filled, radius, gap)
+        grid_img.putpalette(bytes(bg + filled + empty))
+        return grid_img
+    grid_img = empty_grid(rows, cols, radius, gap)
+    grid_img.putpalette(bytes(bg + filled + empty))
+    return fill_dots(grid_img, n_filled, cols, radius, gap, GRID_FILLED)
+
+def write_atomically(out_path: str, write) -> None:
+    # write(tmp) then os.replace, so readers never see a half-written wallpaper
+    tmp = f"{out_path}.tmp.{os.getpid()}"
+    try:
+        write(tmp)
+        os.replace(tmp, out_path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+def save_image(img: Image.Image, out_path: str) -> None:
+    def write(path: str) -> None:
+        if cfg._format == "jpeg":
+            try:
+                import simplejpeg  # optional: faster JPEG encoding than Pillow, only loaded for JPEG output
+            except ImportError:
+                simplejpeg = None
+            if simplejpeg is not None and np is not None:
+                with open(path, "wb") as f:
+                    f.write(simplejpeg.encode_jpeg(np.asarray(img), quality=cfg.jpeg_quality, colorspace="RGB"))
+            else:
+                img.save(path, "JPEG", quality=cfg.jpeg_quality)
+        else:
+            img.save(path, "PNG", compress_level=cfg.png_compress_level)
+    write_atomically(out_path, write)
+
+def render_key(current_cell: int, today: date) -> str:
+    # everything that affects the image: config, current week, today (footer) and this script
+    # _format stands in for output_format, so "jpg" and "jpeg" share renders
+    settings = sorted((k, v) for k, v in asdict(cfg).items() if k != "output_format")
+    state = (settings, current_cell, today.isoformat(), os.path.getmtime(__file__))
+    return hashlib.sha1(repr(state).encode()).hexdigest()[:16]
+
+def prune_cache(prefix: str) -> None:
+    for name in os.listdir(cfg.cache_dir):
+        if name.startswith(prefix) and name.endswith((".png", ".jpg")):
+            try:
+                os.remove(os.path.join(cfg.cache_dir, name))
+            except FileNotFoundError:  # already pruned by an overlapping run
+                pass
+
+def store_cached(out_path: str, key: str) -> None:
+    os.makedirs(cfg.cache_dir, exist_ok=True)
+    prune_cache(CACHE_PREFIX)
+    cached = os.path.join(cfg.cache_dir, f"{CACHE_PREFIX}{key}{cfg._ext}")
+    write_atomically(cached, lambda tmp: shutil.copyfile(out_path, tmp))
+
 def draw_wallpaper() -> str:
-    birth = parse_date(cfg.birthdate)
+    birth = cfg._birth
     today = date.today()
-    frac, days_lived, days_total, current_cell = life_fraction(birth, cfg.expected_years, today)
+    frac, days_lived, days_total, current_cell = life_fraction(today)
+
+    out_path = cfg._out_path
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+
+    # reuse today's render if nothing changed since
+    key = render_key(current_cell, today)
+    if cfg.cache_dir:
+        cached = os.path.join(cfg.cache_dir, f"{CACHE_PREFIX}{key}{cfg._ext}")
+        try:
+            write_atomically(out_path, lambda tmp: shutil.copyfile(cached, tmp))
+            return out_path
+        except FileNotFoundError:
+            pass  # not cached yet, or just pruned by another run
+
     bg, fg, muted, active, filled, empty, grid_shadow = pick_colors(cfg.dark_theme)
 
     img = Image.new("RGB", (cfg.width, cfg.height), bg)
     d = ImageDraw.Draw(img)
 
     # Typography
-    title_font = try_font(96)
-    sub_font = try_font(40)
-    small_font = try_font(26)
+    title_size, sub_size, small_size = 96, 40, 26
+    title_font = try_font(title_size)
+    sub_font = try_font(sub_size)
+    small_font = try_font(small_size)
 
     # Title
-    title_w, title_h = d.textsize(cfg.title, font=title_font)
+    title_w, title_h = text_size(cfg.title, title_size)
     d.text(((cfg.width - title_w) // 2, 40), cfg.title, fill=fg, font=title_font)
 
     # Stats under title
@@ -127,13 +386,13 @@ def draw_wallpaper() -> str:
     lived = format_duration(days_lived)
     remaining = format_duration(max(0, days_total - days_lived))
     stats_line = f"Lived: {lived}   •   Remaining: {remaining}   •   {pct}"
-    stats_w, stats_h = d.textsize(stats_line, font=sub_font)
+    stats_w, stats_h = text_size(stats_line, sub_size)
     stats_y = 40 + title_h + 18
     d.text(((cfg.width - stats_w) // 2, stats_y), stats_line, fill=muted, font=sub_font)
 
     # Legend below stats
     legend = "Each dot = 1 week   •   52 columns = one year"
-    leg_w, leg_h = d.textsize(legend, font=small_font)
+    leg_w, leg_h = text_size(legend, small_size)
     legend_y = stats_y + stats_h + 18
     d.text(((cfg.width - leg_w) // 2, legend_y), legend, fill=muted, font=small_font)
 
@@ -153,28 +412,26 @@ def draw_wallpaper() -> str:
     start_x = (cfg.width - total_w) // 2
     y = margin_top
 
+
     def draw_block(x_left: int, y_top: int, block_rows: int, year_offset: int):
         # subtle outline
         pad = 24
         block_h = block_rows * (radius*2) + (block_rows - 1) * gap + 2*pad
         d.rectangle((x_left-18, y_top-18, x_left+block_w+18, y_top+block_h-18), fill=None, outline=grid_shadow, width=2)
 
-        # rows
-        for r in range(block_rows):
-            year_index = year_offset + r
-            # year tick every 5
-            if cfg.show_year_ticks and (r % 5 == 0 or r == 0):
-                label = str(year_index)
-                lw, lh = d.textsize(label, font=small_font)
-                d.text((x_left - 14 - lw, y_top + r*(2*radius + gap) + radius - lh//2),
-                       label, fill=muted, font=small_font)
-
-            for c in range(cols):
-                idx_global = year_index * cols + c
-                cx = x_left + c * (2*radius + gap) + radius
-                cy = y_top + r * (2*radius + gap) + radius
-                color = filled if idx_global <= current_cell else empty
-                d.ellipse((cx - radius, cy - radius, cx + radius, cy + radius), fill=color)
+        # year tick every 5
+        if cfg.show_year_ticks:
+            for r in range(0, block_rows, 5):
+                label = str(year_offset + r)
+                lw, lh = text_size(label, small_size)
+                mask, (ox, oy) = text_sprite(label, small_size)
+                img.paste(muted, (x_left - 14 - lw + ox, y_top + r*(2*radius + gap) + radius - lh//2 + oy), mask)
+
+        # dots, rendered as a block-sized layer; weeks up to current_cell are filled
+        # (with show_today the current week's dot is drawn with its highlight instead)
+        n_filled = (current_cell if cfg.show_today else current_cell + 1) - year_offset * cols
+        block = render_grid(block_rows, cols, n_filled, radius, gap, bg, filled, empty)
+        img.paste(block, (x_left, y_top))
 
         # highlight current week if it falls in this block
         if cfg.show_today:
@@ -185,8 +442,9 @@ def draw_wallpaper() -> str:
                 cx = x_left + c * (2*radius + gap) + radius
                 cy = y_top + r_rel * (2*radius + gap) + radius
                 pad2 = max(3, radius // 2)
-                d.rectangle((cx - radius - pad2, cy - radius - pad2, cx + radius + pad2, cy + radius + pad2),
-                            outline=active, width=3)
+                d.ellipse((cx - radius, cy - radius, cx + radius, cy + radius), fill=filled)
+                d.rounded_rectangle((cx - radius - pad2, cy - radius - pad2, cx + radius + pad2, cy + radius + pad2),
+                                    radius=pad2, outline=active, width=3)
 
     year_offset = 0
     x = start_x
@@ -197,19 +455,40 @@ def draw_wallpaper() -> str:
 
     # Footer
     footer = f"Born {birth.isoformat()} • Today {today.isoformat()} • Expectancy {cfg.expected_years}y"
-    foot_w, foot_h = d.textsize(footer, font=small_font)
+    foot_w, foot_h = text_size(footer, small_size)
     d.text(((cfg.width - foot_w) // 2, cfg.height - cfg.margin_bottom - foot_h), footer, fill=muted, font=small_font)
 
-    out_path = os.path.abspath(os.path.expanduser(cfg.output_path))
-    os.makedirs(os.path.dirname(out_path), exist_ok=True)
-    img.save(out_path, "PNG", optimize=True)
+    save_image(img, out_path)
+    if cfg.cache_dir:
+        store_cached(out_path, key)
     return out_path
 
+@lru_cache(maxsize=1)
+def path_commands() -> frozenset:
+    # scan $PATH once instead of a shutil.which() walk per probe
+    names = set()
+    for d in os.environ.get("PATH", "").split(os.pathsep):
+        try:
+            names.update(os.listdir(d))
+        except OSError:
+            pass
+    return frozenset(names)
+
 def cmd_exists(cmd: str) -> bool:
-    return shutil.which(cmd) is not None
+    return cmd in path_commands()
 
 def set_wallpaper(path: str) -> bool:
-    # GNOME
+    # GNOME: one `dconf load` for all three keys (quotes escaped for GVariant strings)
+    if cmd_exists("gsettings") and cmd_exists("dconf"):
+        uri = "file://" + path.replace("\\", "\\\\").replace("'", "\\'")
+        payload = f"[/]\npicture-uri='{uri}'\npicture-uri-dark='{uri}'\npicture-options='scaled'\n"
+        try:
+            subprocess.run(["dconf", "load", "/org/gnome/desktop/background/"], input=payload.encode(), check=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            return True
+        except Exception:
+            pass
+    # GNOME without dconf: one gsettings call per key
     if cmd_exists("gsettings"):
         uri = f"file://{path}"
         try:
@@ -223,10 +502,9 @@ def set_wallpaper(path: str) -> bool:
         except Exception:
             pass
     # KDE Plasma (new)
-    kde_cmd = shutil.which("plasma-apply-wallpaperimage")
-    if kde_cmd:
+    if cmd_exists("plasma-apply-wallpaperimage"):
         try:
-            subprocess.run([kde_cmd, path], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            subprocess.run(["plasma-apply-wallpaperimage", path], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             return True
         except Exception:
             pass
@@ -270,7 +548,12 @@ for (i=0;i<allDesktops.length;i++) {{
             pass
     return False
 
+def pillow_version() -> str:
+    # Pillow-SIMD releases carry a ".postN" suffix, e.g. "9.5.0.post1"
+    return f"Pillow {PIL.__version__}" + (" (SIMD)" if "post" in PIL.__version__ else "")
+
 def main():
+    print(f"Using {pillow_version()}")
     out = draw_wallpaper()
     print(f"Generated: {out}")
     if cfg.set_wallpaper: